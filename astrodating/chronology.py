@@ -12,7 +12,11 @@ chronology unless the constraints are answered.
 import numpy as np
 import pandas as pd
 import ast
-import copy
+import collections
+import functools
+import json
+import re
+import sys
 
 
 __all__ = [
@@ -21,11 +25,14 @@ __all__ = [
 ]
 
 CONSTANTS = {
+    'CHRONOLOGY' : 'CHRONOLOGY',
     'DATETIME_EPOCH': 1970,
     'COMMENT' : '#',
+    'COMMENTS' : 'COMMENTS',
     'LEFTBRACE' : '{',
     'NEGATIVE' : '-',
     'NEWLINE' : '\n',
+    'NPZ' : '.npz',
     'SPACE' : ' ',
 }
 
@@ -36,6 +43,7 @@ KEYS = {
     'BEGIN' : 'BEGIN',
     'CALENDAR' : 'CALENDAR',
     'CHALLENGES' : 'CHALLENGES',
+    'DATE' : 'DATE',
     'END' : 'END',
     'EVENTS' : 'EVENTS',
     'EXPERIMENT' : 'Experiment',
@@ -66,7 +74,7 @@ CALENDARS = {
         'NAME' : 'Experiment',
         'POS LABEL' : '',
         'NEG LABEL' : '',
-        'Zero Year' : -CONSTANTS['DATETIME_EPOCH'],
+        'ZERO YEAR' : -CONSTANTS['DATETIME_EPOCH'],
         'USE ZERO' : False,
     },
     'Gregorian' : {
@@ -86,6 +94,29 @@ CALENDARS = {
 }
 
 
+# The values of each calendar that a chronology reads, gathered once per calendar.
+CalendarSpec = collections.namedtuple(
+    'CalendarSpec',
+    'name poslabel poslabellen neglabel neglabellen zeroyear usezero',
+)
+
+def _calendarspec(calendar: dict) -> CalendarSpec:
+    """Gather the values of a calendar dictionary, with no labels for those it lacks."""
+    poslabel = sys.intern(calendar.get(KEYS['POSLABEL'], ''))
+    neglabel = sys.intern(calendar.get(KEYS['NEGLABEL'], ''))
+    return CalendarSpec(
+        calendar.get(KEYS['NAME'], ''),
+        poslabel,
+        len(poslabel),
+        neglabel,
+        len(neglabel),
+        calendar.get(KEYS['ZEROYEAR'], -CONSTANTS['DATETIME_EPOCH']),
+        calendar.get(KEYS['USEZERO'], False),
+    )
+
+CALENDARSPECS = {name : _calendarspec(calendar) for name, calendar in CALENDARS.items()}
+
+
 # Date and time units from https://numpy.org/doc/stable/reference/arrays.datetime.html
 DATETIMES = {
     'ATTOSECOND' : 'as',
@@ -103,6 +134,198 @@ DATETIMES = {
     'YEAR' : 'Y',
 }
 
+# Keys that cannot be used as the extra keys of an entry or removed from a dictionary.
+RESERVEDKEYS = frozenset(KEYS)
+
+# Every numeric date has the same resolution so arrays of them need no unit promotion.
+NUMERICDTYPE = np.dtype('datetime64[s]')
+
+# The year of a date in ISO format, possibly negative.
+YEARPATTERN = re.compile(r'-?[0-9]+')
+
+# The constants above never change, so their displays are only built once.
+CALENDARS_DATAFRAME = pd.DataFrame.from_dict(CALENDARS)
+DATETIMES_DATAFRAME = pd.DataFrame.from_dict(DATETIMES, orient='index', columns=['Value'])
+KEYS_DATAFRAME = pd.DataFrame.from_dict(KEYS, orient='index', columns=['Value'])
+
+
+def _yeardays(year: int) -> int:
+    """Count the number of days in a Gregorian year.
+
+    A multiple of 4 is a multiple of 100 exactly when it is a multiple of 25,
+    and such a year is a multiple of 400 exactly when it is a multiple of 16.
+    This replaces two of the divisions by bit masks.
+    """
+    return 365 + ((year & 3) == 0 and ((year % 25) != 0 or (year & 15) == 0))
+
+
+@functools.lru_cache(maxsize=4096)
+def _daysinyear(date: str|np.datetime64) -> int:
+    """Count the number of days in the Gregorian year of a date.
+
+    A year-only string is read as an integer.  Other dates are parsed by
+    NumPy so that invalid dates are rejected.  Reading the year costs far
+    more than the leap-year test, so results are cached by date as in
+    `_numericdate`.
+    """
+    if isinstance(date, str):
+        if YEARPATTERN.fullmatch(date):
+            return _yeardays(int(date))
+        year = np.datetime64(date, DATETIMES['YEAR']).astype('int') + CONSTANTS['DATETIME_EPOCH']
+    else:
+        year = date.astype('datetime64[Y]').astype('int') + CONSTANTS['DATETIME_EPOCH']
+    return _yeardays(int(year))
+
+
+def _daysinyears(years: np.ndarray) -> np.ndarray:
+    """Count the number of days in each of an array of Gregorian years.
+
+    Only whether a year is divisible by 25 matters, so the truncating
+    `np.fmod` is used rather than `%`, whose floored result for negative
+    years costs NumPy extra work.
+    """
+    years = np.asarray(years, dtype=np.int64)
+    leap = ((years & 3) == 0) & ((np.fmod(years, 25) != 0) | ((years & 15) == 0))
+    days = leap.astype(np.int32)
+    days += 365
+    return days
+
+
+def _checkrange(stems: np.ndarray, numericdates: np.ndarray):
+    """Raise a ValueError for a date whose year is outside the range of NUMERICDTYPE.
+
+    Converting to NUMERICDTYPE wraps such dates silently.  Every year of
+    fewer than twelve digits fits, so only the longer strings are parsed
+    again by year and compared.
+    """
+    long = np.char.str_len(stems) >= 12
+    if long.any():
+        years = stems[long].astype(f'datetime64[{DATETIMES["YEAR"]}]')
+        wrapped = (numericdates[long].astype(years.dtype) != years) & ~np.isnat(years)
+        if wrapped.any():
+            raise ValueError(f'The date "{stems[long][wrapped][0]}" is outside the range of {NUMERICDTYPE} dates.')
+
+
+def _classify(date: str, neglabel: str, poslabel: str) -> tuple:
+    """Return which label ends the date, `neg`, `pos` or `plain`, and the date without it.
+
+    An empty label never matches.
+    """
+    for label, suffix in (('neg', neglabel), ('pos', poslabel)):
+        if suffix and date.endswith(suffix):
+            return label, date[:-len(suffix)]
+    return 'plain', date
+
+
+@functools.lru_cache(maxsize=4096)
+def _numericdate(date: str, neglabel: str, poslabel: str, usezero: bool) -> np.datetime64:
+    """Convert a labelled date string to astronomical year numbering.
+
+    The result depends only on the arguments so it is cached.  Chronologies
+    tend to repeat the same dates, and the cache is bounded so that a stream
+    of unique dates cannot grow it without limit.  The validation is done
+    here as well so that a repeated date costs a single cache lookup.
+    """
+    label, stem = _classify(date, neglabel, poslabel)
+
+    # Look for errors
+    if label != 'plain' and date.startswith(CONSTANTS['NEGATIVE']):
+        kind, suffix = {'neg' : ('negative', neglabel), 'pos' : ('positive', poslabel)}[label]
+        raise ValueError(f'The year is negative but the date contains a {kind} label "{suffix}"')
+
+    # If no errors, proceed
+    sign = CONSTANTS['NEGATIVE'] if label == 'neg' else ''
+    if YEARPATTERN.fullmatch(stem):
+        # Year only dates are the most common and need no ISO parsing.
+        year = int(sign + stem)
+        numericdate = np.datetime64(year - CONSTANTS['DATETIME_EPOCH'], DATETIMES['YEAR'])
+    else:
+        numericdate = np.datetime64(sign + stem)
+        year = int(numericdate.astype('datetime64[Y]').astype('int')) + CONSTANTS['DATETIME_EPOCH']
+    if label == 'neg' and not usezero:
+        numericdate = numericdate + np.timedelta64(_yeardays(year), 'D')
+    seconds = numericdate.astype(NUMERICDTYPE)
+    if seconds.astype(numericdate.dtype) != numericdate:
+        raise ValueError(f'The date "{date}" is outside the range of {NUMERICDTYPE} dates.')
+    return seconds
+
+
+def _todataframe(dictionary: dict) -> pd.DataFrame:
+    """Build a DataFrame with one row for each entry of a chronology dictionary.
+
+    The entries are passed as a list of records with the names as the index.
+    pandas gathers the columns of the records in one pass, which is faster
+    than `from_dict(orient='index')` when entries have different keys.
+    """
+    return pd.DataFrame(list(dictionary.values()), index=list(dictionary))
+
+
+def _datecolumns(dictionary: dict) -> dict:
+    """Return the names and the `BEGIN` and `END` dates of a dictionary as parallel arrays.
+
+    Missing dates are empty strings.
+    """
+    begin = KEYS['BEGIN']
+    end = KEYS['END']
+    dates = np.array([
+        [entry.get(begin, ''), entry.get(end, '')]
+        for entry in dictionary.values()
+    ], dtype=str).reshape(-1, 2)
+    return {
+        KEYS['NAME'] : np.array(list(dictionary), dtype=object),
+        begin : dates[:, 0],
+        end : dates[:, 1],
+    }
+
+
+def _loadline(line: str) -> dict:
+    """Read one dictionary line of a chronology file.
+
+    Chronologies are saved one JSON object per line, which `json` parses in C.
+    Files saved as Python literals by earlier versions are still read with
+    `ast.literal_eval`.
+    """
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return ast.literal_eval(line)
+
+
+def _loadlines(lines: list) -> list:
+    """Read the dictionary lines of a chronology file.
+
+    The lines are joined into one JSON array so that the whole file is parsed
+    in a single `json.loads` call.  A file saved as Python literals is parsed
+    in a single `ast.literal_eval` call the same way.  Only a file mixing the
+    two is read line by line with `_loadline`.
+    """
+    array = f'[{",".join(lines)}]'
+    try:
+        return json.loads(array)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return ast.literal_eval(array)
+    except (ValueError, SyntaxError):
+        return [_loadline(line) for line in lines]
+
+
+def _loaddocument(lines: list) -> dict | None:
+    """Return the document of a file saved by `save_as_json`, or `None` for any other file.
+
+    Such a file is a single line holding a JSON object with only the
+    comments and the chronology.
+    """
+    if len(lines) != 1 or lines[0][:1] != CONSTANTS['LEFTBRACE']:
+        return None
+    try:
+        document = json.loads(lines[0])
+    except json.JSONDecodeError:
+        return None
+    if document.keys() == {CONSTANTS['COMMENTS'], CONSTANTS['CHRONOLOGY']}:
+        return document
+    return None
+
 
 class Compare():
     """Compare two or more chronologies for the same events.
@@ -125,6 +348,8 @@ class Compare():
     The challenges by each of these chronologies are used
     """
 
+    __slots__ = ('chronologies',)
+
     def __init__(self, chronologies: list):
         self.chronologies = chronologies
 
@@ -189,6 +414,20 @@ class Chronology():
 
     """
 
+    __slots__ = (
+        'calendar',
+        'chronology',
+        'commentlist',
+        'filename',
+        'maindictionaries',
+        'name',
+        'neglabel',
+        'neglabellen',
+        'poslabel',
+        'poslabellen',
+        'usezero',
+    )
+
     def __init__(self,
                  chronologyname: str = '',
                  filename: str = '',
@@ -220,20 +459,27 @@ class Chronology():
             }
             
             self.chronology[KEYS['CALENDAR']].update(CALENDARS[calendar])
-            self.name = self.chronology[KEYS['NAME']]
-            self.calendar = self.chronology[KEYS['CALENDAR']][KEYS['NAME']]
-            self.poslabel = CALENDARS[self.calendar][KEYS['POSLABEL']]
-            self.poslabellen = len(CALENDARS[self.calendar][KEYS['POSLABEL']])
-            self.neglabel = CALENDARS[self.calendar][KEYS['NEGLABEL']]
-            self.neglabellen = len(CALENDARS[self.calendar][KEYS['NEGLABEL']])
+        elif filename.endswith(CONSTANTS['NPZ']):
+            with np.load(filename) as arrays:
+                document = json.loads(str(arrays[CONSTANTS['CHRONOLOGY']]))
+                self.commentlist = document[CONSTANTS['COMMENTS']]
+                self.chronology = document[CONSTANTS['CHRONOLOGY']]
         else:
             self.chronology = {}
             with open(filename) as file:
-                for line in file:
-                    if line[0] == CONSTANTS['LEFTBRACE']:
-                        self.chronology.update(ast.literal_eval(line))
-                    else:  
-                        self.commentlist.append(line.replace(CONSTANTS['NEWLINE'], ''))
+                lines = file.read().splitlines()
+            document = _loaddocument(lines)
+            if document is not None:
+                self.commentlist = document[CONSTANTS['COMMENTS']]
+                self.chronology = document[CONSTANTS['CHRONOLOGY']]
+            else:
+                leftbrace = CONSTANTS['LEFTBRACE']
+                dictlines = [line for line in lines if line[:1] == leftbrace]
+                self.commentlist = [line for line in lines if line[:1] != leftbrace]
+                for dictionary in _loadlines(dictlines):
+                    self.chronology.update(dictionary)
+        self.name = self.chronology.get(KEYS['NAME'], '')
+        self._refresh_calendar()
                         
 
     def __str__(self):
@@ -244,6 +490,40 @@ class Chronology():
         self.comments()
         self.dictionaries()
     
+    def _dataframe(self, dictname: str) -> pd.DataFrame:
+        """Return a dictionary of the chronology as a DataFrame."""
+        return _todataframe(self.chronology[dictname])
+
+    def _numericcolumns(self, dictname: str) -> dict:
+        """Return the names and numeric dates of a dictionary as parallel arrays.
+
+        The dates are converted together with `numericdates`.  Missing dates are `NaT`.
+        """
+        columns = _datecolumns(self.chronology[dictname])
+        dates = self.numericdates(np.stack([columns[KEYS['BEGIN']], columns[KEYS['END']]]))
+        return {
+            KEYS['NAME'] : columns[KEYS['NAME']],
+            KEYS['BEGIN'] : dates[0],
+            KEYS['END'] : dates[1],
+        }
+
+    def _refresh_calendar(self):
+        """Set the calendar name, labels and year zero rule from the chronology's calendar.
+
+        A chronology read from a file without a calendar uses the Gregorian calendar.
+        A calendar that is not one of the CALENDARS is read from the file.
+        """
+        calendar = self.chronology.get(KEYS['CALENDAR'], {})
+        self.calendar = calendar.get(KEYS['NAME'], KEYS['GREGORIAN'])
+        spec = CALENDARSPECS.get(self.calendar)
+        if spec is None:
+            spec = _calendarspec(calendar)
+        self.poslabel = spec.poslabel
+        self.poslabellen = spec.poslabellen
+        self.neglabel = spec.neglabel
+        self.neglabellen = spec.neglabellen
+        self.usezero = spec.usezero
+
     def rename(self, newname: str):
         """Rename the chronology."""
         self.chronology.update({KEYS['NAME'] : newname})
@@ -263,7 +543,7 @@ class Chronology():
     def actors(self) -> pd.DataFrame:
         """Display the actors in a chronology."""
         if len(self.chronology[KEYS['ACTORS']]) > 0:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['ACTORS']], orient='index')
+            return self._dataframe(KEYS['ACTORS'])
         else:
             print(f'The chronology "{self.name}" has no actors.')
 
@@ -276,28 +556,11 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the actors.
             
         """
-        self.dictionary_pop(self, pops, KEYS['ACTORS'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['ACTORS']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
-
-    def add_actor(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+        return self.dictionary_pop(pops, KEYS['ACTORS'])
+
+    def add_actor(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add an actor to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['ACTORS'], name, begin, end, keyvalues)
 
     def remove_actor(self, name):
         """Remove an actor from the dictionary."""
@@ -308,31 +571,43 @@ class Chronology():
 
     def datetimes(self) -> pd.DataFrame:
         """Display the DATETIMES constants."""
-        return pd.DataFrame.from_dict(DATETIMES, orient='index', columns=['Value'])
+        return DATETIMES_DATAFRAME.copy()
     
-    def daysinyear(self, date:str|np.datetime64):
+    def daysinyear(self, date: str|np.datetime64|np.ndarray):
         """A procedure to count number of days in a Gregorian year given the year.
         
         Parameters
         ----------
-        date: np.datetime64
-            The date to find the number of days in the year
+        date: str, np.datetime64 or np.ndarray
+            The date to find the number of days in the year.  An array of dates
+            returns an array with the number of days in the year of each date.
             
         Examples
         --------
 
         """
-        if isinstance(date, str):
-            year = np.datetime64(date,'Y').astype('int') + 1970
-        else:
-            year = date['Y'].astype('int') + 1970
-        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-            return 366
-        else:
-            return 365
+        if isinstance(date, (str, np.datetime64)):
+            return _daysinyear(date)
+        years = np.asarray(date, dtype='datetime64').astype('datetime64[Y]').astype('int')
+        return _daysinyears(years + CONSTANTS['DATETIME_EPOCH'])
+
+    def daysinyears(self, years: list|np.ndarray) -> np.ndarray:
+        """A procedure to count the number of days in many Gregorian years at once.
+
+        Parameters
+        ----------
+        years: list or np.ndarray
+            The integer years in astronomical year numbering.
 
+        Returns
+        -------
+        np.ndarray
+            The number of days in each year.
 
-    def numericdate(self, date: str, unit: str = DATETIMES['YEAR']):
+        """
+        return _daysinyears(years)
+
+    def numericdate(self, date: str|list|np.ndarray, unit: str = DATETIMES['YEAR']):
         """A procedure to convert an ISO string with KEYS to astronomical year numbering.
         This numeric value contains a Year Zero as 0.  Dates labelled as `BC` or `BCE`
         will be converted to a negative value one year larger than the string date with
@@ -340,38 +615,80 @@ class Chronology():
         
         Parameters
         ----------
-        date: string
-            The date that will be converted to a numeric value.
+        date: string, list or np.ndarray
+            The date that will be converted to a numeric value.  A list or array of
+            dates is converted together by `numericdates`.
 
         Returns
         -------
-        np.datetime64
+        np.datetime64 or np.ndarray
             The numeric value of the date in astronomical time with Year Zero being 0.
+            The value has a resolution of one second.
 
         Examples
         --------
         >>> 
 
         """
-        # Look for errors
-        if date[0] == CONSTANTS['NEGATIVE']:
-            if date[-self.neglabellen:] == self.neglabel:
-                raise ValueError(f'The year is negative but the date contains a negative label "{date[-self.neglabellen:]}"')
-            elif date[-self.poslabellen:] == self.poslabel:
-                raise ValueError(f'The year is negative but the date contains a positive label "{date[-self.poslabellen:]}"')
-
-        # If no errors, proceed
-        if date[-self.neglabellen:] == self.neglabel:
-            if self.usezero:
-                numericdate = np.datetime64('-'+date[0:-self.neglabellen])
-            else:
-                days = self.daysinyear(date[0:-self.neglabellen])
-                numericdate = np.datetime64('-'+date[0:-self.neglabellen]) + np.timedelta64(days, 'D')
-        elif date[-self.poslabellen:] == self.poslabel:
-            numericdate = np.datetime64(date[0:-self.poslabellen])
+        if isinstance(date, str):
+            return _numericdate(date, self.neglabel, self.poslabel, self.usezero)
+        return self.numericdates(date)
+
+    def numericdates(self, dates: list|np.ndarray) -> np.ndarray:
+        """A procedure to convert many dates to astronomical year numbering at once.
+        This is the vectorized form of `numericdate`.
+
+        Parameters
+        ----------
+        dates: list or np.ndarray
+            The dates that will be converted to numeric values.
+
+        Returns
+        -------
+        np.ndarray
+            The numeric values of the dates in astronomical time with Year Zero being 0.
+            The values have a resolution of one second.
+
+        See Also
+        --------
+        `numericdate`
+            Convert a single date.
+
+        """
+        dates = np.asarray(dates, dtype=str)
+        shape = dates.shape
+        # Chronologies repeat dates, so only the distinct ones are converted.
+        dates, inverse = np.unique(dates.ravel(), return_inverse=True)
+        neglabel = self.neglabel
+        poslabel = self.poslabel
+        nolabel = np.zeros(dates.shape, dtype=bool)
+        if neglabel == '':
+            neg = nolabel
+        else:
+            neg = np.char.endswith(dates, neglabel)
+        if poslabel == '':
+            pos = nolabel
         else:
-            numericdate = np.datetime64(date)
-        return numericdate
+            pos = np.char.endswith(dates, poslabel) & ~neg
+
+        # Look for errors
+        errors = np.char.startswith(dates, CONSTANTS['NEGATIVE']) & (neg | pos)
+        if errors.any():
+            raise ValueError(f'The year is negative but the date contains a label "{dates[errors][0]}"')
+
+        # If no errors, proceed.  Only the labelled dates are rewritten, into an
+        # array one character wider to leave room for the negative sign.
+        stems = dates.astype(f'<U{dates.dtype.itemsize // 4 + 1}')
+        if neg.any():
+            stems[neg] = np.char.add(CONSTANTS['NEGATIVE'], np.char.replace(dates[neg], neglabel, ''))
+        if pos.any():
+            stems[pos] = np.char.replace(dates[pos], poslabel, '')
+        numericdates = stems.astype(NUMERICDTYPE)
+        _checkrange(stems, numericdates)
+        if not self.usezero and neg.any():
+            years = numericdates[neg].astype('datetime64[Y]').astype('int') + CONSTANTS['DATETIME_EPOCH']
+            numericdates[neg] += _daysinyears(years).astype('timedelta64[D]')
+        return numericdates[inverse].reshape(shape)
 
     def stringdate(self, date: np.datetime64, unit: str = DATETIMES['YEAR']):
         """A procedure to convert a numeric date to a date labelled with an epoch label.
@@ -387,22 +704,33 @@ class Chronology():
         else:
             return np.datetime_as_string(date, unit='D')
 
+    def stringdates(self, dates: list|np.ndarray) -> np.ndarray:
+        """Convert an array of numeric dates to strings.
+
+        Missing dates, `None` or `NaT`, become empty strings as in `stringdate`.
+
+        Parameters
+        ----------
+        dates: list | np.ndarray
+            The numeric dates to be converted to strings.
+
+        See Also
+        --------
+        `stringdate`
+            Convert a single numeric date.
+        """
+        dates = np.asarray(dates, dtype=NUMERICDTYPE)
+        stringdates = np.datetime_as_string(dates, unit='D')
+        stringdates[np.isnat(dates)] = ''
+        return stringdates
+
     def calendars(self) -> pd.DataFrame:
         """Display the CALENDARS constants."""
-        return pd.DataFrame.from_dict(CALENDARS)
+        return CALENDARS_DATAFRAME.copy()
     
-    def add_calendar(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+    def add_calendar(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add a calendar to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['PERIODS'], name, begin, end, keyvalues)
 
     def to(self, calendar: str):
         """Convert the calendar of the chronology to anther calendar.
@@ -412,55 +740,58 @@ class Chronology():
         calendar: str
             The key of the calendar to convert the current calendar to.
         """
-        labelcalendars = [KEYS['GREGORIAN'], KEYS['SECULAR']]
+        labelcalendars = (KEYS['GREGORIAN'], KEYS['SECULAR'])
         formercalendar = CALENDARS[self.calendar]
-        poslabel = formercalendar[KEYS['POSLABEL']]
-        poslabellen = -len(poslabel)
         newcalendar = CALENDARS[calendar]
-        if CALENDARS[calendar][KEYS['NAME']] == self.calendar:
+        if newcalendar[KEYS['NAME']] == self.calendar:
             print(f'The chronology already has the "{self.calendar}" calendar.')
         else:
             if calendar in labelcalendars and self.calendar in labelcalendars:
+                for dictname in [KEYS['PERIODS'], KEYS['EVENTS']]:
+                    self._relabel(dictname, formercalendar, newcalendar)
                 self.chronology[KEYS['CALENDAR']].update(newcalendar)
-                for i in self.chronology[KEYS['PERIODS']]:
-                    for k in [KEYS['BEGIN'], KEYS['END']]:
-                        if self.chronology[KEYS['PERIODS']][i][k][poslabellen:] == poslabel:
-                            newvalue = self.chronology[KEYS['PERIODS']][i][k].replace(
-                                formercalendar[KEYS['POSLABEL']], 
-                                newcalendar[KEYS['POSLABEL']]
-                            )
-                        else:
-                            newvalue = self.chronology[KEYS['PERIODS']][i][k].replace(
-                                formercalendar[KEYS['NEGLABEL']], 
-                                newcalendar[KEYS['NEGLABEL']]
-                            )
-                        self.chronology[KEYS['PERIODS']][i].update({k : newvalue})
-                for i in self.chronology[KEYS['EVENTS']]:
-                    for k in [KEYS['DATE']]:
-                        if self.chronology[KEYS['EVENTS']][i][k][poslabellen:] == poslabel:
-                            newvalue = self.chronology[KEYS['EVENTS']][i][k].replace(
-                                formercalendar[KEYS['POSLABEL']], 
-                                newcalendar[KEYS['POSLABEL']]
-                            )
-                        else:
-                            newvalue = self.chronology[KEYS['EVENTS']][i][k].replace(
-                                formercalendar[KEYS['NEGLABEL']], 
-                                newcalendar[KEYS['NEGLABEL']]
-                            )
-                        self.chronology[KEYS['EVENTS']][i].update({k : newvalue})
-            self.calendar = self.chronology[KEYS['CALENDAR']][KEYS['NAME']]
-            self.poslabel = CALENDARS[self.calendar][KEYS['POSLABEL']]
-            self.poslabellen = len(CALENDARS[self.calendar][KEYS['POSLABEL']])
-            self.neglabel = CALENDARS[self.calendar][KEYS['NEGLABEL']]
-            self.neglabellen = len(CALENDARS[self.calendar][KEYS['NEGLABEL']])
+            self._refresh_calendar()
             print(f'The chronology has been changed to the "{self.calendar}" calendar.')
 
+    def _relabel(self, dictname: str, formercalendar: dict, newcalendar: dict):
+        """Replace the labels of one calendar by those of another in a dictionary.
+
+        All of the `BEGIN` and `END` dates are relabelled together with NumPy
+        string operations and then written back to the entries that have them.
+        The dates are read from the dictionary itself so that changes made to
+        it directly are kept.
+        """
+        dictionary = self.chronology[dictname]
+        columns = _datecolumns(dictionary)
+        names = columns[KEYS['NAME']]
+        if len(names) == 0:
+            return
+        poslabel = formercalendar[KEYS['POSLABEL']]
+        neglabel = formercalendar[KEYS['NEGLABEL']]
+        newposlabel = newcalendar[KEYS['POSLABEL']]
+        newneglabel = newcalendar[KEYS['NEGLABEL']]
+        for key in [KEYS['BEGIN'], KEYS['END']]:
+            dates = columns[key]
+            if poslabel == '':
+                pos = np.zeros(dates.shape, dtype=bool)
+            else:
+                pos = np.char.endswith(dates, poslabel)
+            newdates = np.where(
+                pos,
+                np.char.replace(dates, poslabel, newposlabel),
+                np.char.replace(dates, neglabel, newneglabel),
+            )
+            for name, newdate in zip(names, newdates.tolist()):
+                entry = dictionary[name]
+                if key in entry:
+                    entry[key] = newdate
+
     ###### CHALLENGES 
 
     def challenges(self) -> pd.DataFrame:
         """Display the challenges in a chronology."""
         if len(self.chronology[KEYS['CHALLENGES']]) > 0:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['CHALLENGES']], orient='index')
+            return self._dataframe(KEYS['CHALLENGES'])
         else:
             print(f'The chronology "{self.name}" has no challenges.')
 
@@ -473,28 +804,11 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the periods.
             
         """
-        self.dictionary_pop(self, pops, KEYS['CHALLENGES'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['CHALLENGES']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
-
-    def add_challenge(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+        return self.dictionary_pop(pops, KEYS['CHALLENGES'])
+
+    def add_challenge(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add a challenge to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['CHALLENGES'], name, begin, end, keyvalues)
 
     def remove_challenge(self, name):
         """Remove a challenge from the dictionary."""
@@ -543,15 +857,13 @@ class Chronology():
         if text == '':
             self.commentlist.append(CONSTANTS['SPACE'])
         else:
-            texts = text.split(CONSTANTS['NEWLINE'])
-            for i in texts:
-                self.commentlist.append(i.replace(CONSTANTS['NEWLINE'], ''))
+            self.commentlist.extend(text.splitlines())
 
         
     def comments(self):
         """Display a numbered list of comments."""
-        for i in range(0, len(self.commentlist)):
-            print('{:>3} : {}'.format(str(i),self.commentlist[i]))
+        if len(self.commentlist) > 0:
+            print(CONSTANTS['NEWLINE'].join(f'{i:>3} : {comment}' for i, comment in enumerate(self.commentlist)))
 
     def remove_comment(self, index: int):
         """Remove a comment from the chronology by specifying its number in the comments list."""
@@ -568,20 +880,34 @@ class Chronology():
 
     def keys(self) -> pd.DataFrame:
         """Display the KEYS constants."""
-        return pd.DataFrame.from_dict(KEYS, orient='index', columns=['Value'])
+        return KEYS_DATAFRAME.copy()
     
     def dictionaries(self):
-        for key in self.chronology.keys():
-            if isinstance(self.chronology[key], dict):
-                if len(self.chronology[key]) > 0:
-                    print('{} : {}'.format(key, '{'))
-                    for subkey in self.chronology[key]:
-                        print('    {} : {}'.format(subkey, self.chronology[key][subkey]))
-                    print('}')
-                else:
-                    print('{} : {}'.format(key, self.chronology[key]))
+        """Display the dictionaries of the chronology."""
+        lines = []
+        for key, value in self.chronology.items():
+            if isinstance(value, dict) and len(value) > 0:
+                lines.append(f'{key} : {{')
+                lines.extend(f'    {subkey} : {subvalue}' for subkey, subvalue in value.items())
+                lines.append('}')
             else:
-                print('{} : {}'.format(key, self.chronology[key]))
+                lines.append(f'{key} : {value}')
+        print(CONSTANTS['NEWLINE'].join(lines))
+
+    def _add(self, dictname: str, name: str, begin: str, end: str, keyvalues: dict | None):
+        """Add an entry with its dates and other keys to a dictionary of the chronology."""
+        entry = {
+            KEYS['BEGIN'] : begin,
+            KEYS['END'] : end,
+        }
+        if keyvalues:
+            reserved = RESERVEDKEYS.intersection(keyvalues)
+            if reserved:
+                raise ValueError(f'The keys {sorted(reserved)} are reserved keys.')
+            entry.update(keyvalues)
+        if isinstance(name, str):
+            name = sys.intern(name)
+        self.chronology[dictname][name] = entry
 
     def dictionary_pop(self, pops: list, dictname: str):
         """Display the dictionary except for specified keys.
@@ -594,14 +920,28 @@ class Chronology():
             The name of the dictionary to display.
             
         """
-        dictionary = copy.deepcopy(dict(self.chronology[dictname]))
-        for i in pops:
-            for j in dictionary:
-                try:
-                    dictionary[j].pop(i)
-                except KeyError:
-                    break
-        return pd.DataFrame.from_dict(dictionary, orient='index')
+        pops = set(pops)
+        dictionary = {
+            name : {key : value for key, value in entry.items() if key not in pops}
+            for name, entry in self.chronology[dictname].items()
+        }
+        return _todataframe(dictionary)
+
+    def dictionary_numeric(self, dictname: str) -> pd.DataFrame:
+        """Display the dictionary with its dates converted to numeric dates.
+
+        Parameter
+        ---------
+        dictname: str
+            The name of the dictionary to display.
+            
+        """
+        dataframe = self._dataframe(dictname)
+        columns = self._numericcolumns(dictname)
+        for key in [KEYS['BEGIN'], KEYS['END']]:
+            if key in dataframe.columns:
+                dataframe[key] = columns[key]
+        return dataframe
     
     def remove_key(self, dictname: str, key: str):
         """Revove a key from a dictionary of the chronology.  
@@ -617,7 +957,7 @@ class Chronology():
             The name of the key to be removed from the dictionary
         
         """
-        if key in KEYS.keys():
+        if key in RESERVEDKEYS:
             raise ValueError(f'The key "{key}" is a reserved key and cannot be removed.')
         elif key not in self.chronology[dictname].keys():
             raise ValueError(f'The key "{key}" is not in the chronology dictionary "{dictname}".')
@@ -630,7 +970,7 @@ class Chronology():
     def events(self) -> pd.DataFrame:
         """Display the EVENTS constants."""
         if len(self.chronology[KEYS['EVENTS']]) > 0:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['EVENTS']], orient='index')
+            return self._dataframe(KEYS['EVENTS'])
         else:
             print(f'The chronology "{self.name}" has no events.')
 
@@ -644,171 +984,71 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the events.
             
         """
-        self.dictionary_pop(self, pops, KEYS['EVENTS'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['EVENTS']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
-    
+        return self.dictionary_pop(pops, KEYS['EVENTS'])
     
-    # def add_event(self, event: str, date: str, text: str = ''):
-    #     """Add an event in a chronology and to its event ordering.
-        
-    #     Parameters
-    #     ----------
-    #     event: string
-    #         The name of the event to add
-    #     date: string
-    #         The date of the event to add.
-    #         The date is in ISO format `YYYY-MM-DDTHH:MM:SS.SSS` with only the year required.
-    #         Otional ' AD', ' BC', ' CE', ' BCE' KEYS may be added.
-    #         The years may be negative if the KEYS are not used.
-    #         The years may be arbitrarily large outside of the range of the current julian period.
-    #     text: string (Optional)
-    #         Reference to the text justifying this event and date
-
-    #     Returns
-    #     -------
-    #     string
-    #         A message stating that the event at a certain date with a reference text
-    #         was added to the chronology.
-
-    #     Examples
-    #     --------
-
-    #     """
-    #     pass
-        # if self.name == '':
-        #     raise ValueError('The chronology name is empty.')
-        # else:
-        #     numericdate = super().numeric(date)
-        #     numericdatetype = type(numericdate)
-        #     self.chronology[event] = [date, super().numeric(date), text]
-        #     self.eventorder.append(event)
-        #     return(f'Event "{event}" with date "{date}" and text "{text}" has been added to the "{self.name}" chronology.')
     
-    def add_event(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+    def add_event(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add an event to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['EVENTS'], name, begin, end, keyvalues)
 
     def remove_event(self, name):
         """Remove an event from the dictionary."""
         self.chronology[KEYS['EVENTS']].pop(name)
 
 
-    # def update_event(self, event: str, date: str, text: str = ''):
-    #     """Update an event in a chronology.
+    def show_eventorder(self) -> list:
+        """Display a list of events in the order they will be shown.
         
-    #     Parameters
-    #     ----------
-    #     event: string
-    #         The name of the event to update
-    #     date: string
-    #         The date of the event to update.
-    #         The date is in ISO format `YYYY-MM-DDTHH:MM:SS.SSS` with only the year required.
-    #         Otional ' AD', ' BC', ' CE', ' BCE' KEYS may be added.
-    #         The years may be negative if the KEYS are not used.
-    #         The years may be arbitrarily large outside of the range of the current julian period.
-    #     text: string
-    #         Reference to the text justifying this event and date
-
-    #     Returns
-    #     -------
-    #     string
-    #         A message stating that the event at a certain date with a reference text
-    #         was updated in the chronology
-
-    #     Examples
-    #     --------
-
-    #     """
-    #     if self.name == '':
-    #         raise ValueError('The chronology name is empty.')
-    #     else:
-    #         self.chronology.update({event : [date, super().numeric(date), text]})
-    #         return(f'Event "{event}" with date "{date}" and text "{text}" has been added to the "{self.name}" chronology.')
-
-    # def remove_event(self, event: str):
-    #     """Remove an event from a chronology and its event ordering.
-        
-    #     Parameters
-    #     ----------
-    #     event: string
-    #         The name of the event to remove
-
-    #     Returns
-    #     -------
-    #     string
-    #         A message stating that the event has been removed from the chronology.
-
-    #     """
-    #     if self.name == '':
-    #         raise ValueError('The chronology name is empty.')
-    #     else:
-    #         self.chronology.pop(event)
-    #         self.eventorder.remove(event)
-    #         print(f'Event "{event}" has been removed from the "{self.name}" chronology.')
-
-
-    # def show_eventorder(self):
-    #     """Display a list of events in the order they will be shown.
-        
-    #     Returns
-    #     -------
-    #     list
-    #         A list of events in the order they will appear
+        Returns
+        -------
+        list
+            A list of events in the order they will appear
             
-    #     Examples
-    #     --------
+        Examples
+        --------
 
-    #     """
-    #     if self.chronology[KEYS['NAME']] == '':
-    #         raise ValueError('The chronology name is empty.')
-    #     else:
-    #         return self.eventorder
+        """
+        # The events dictionary keeps its insertion order, which is the event order.
+        return list(self.chronology[KEYS['EVENTS']])
 
-    # def update_eventorder(self, events: list):
-    #     """Update the event ordering of a chronology.
+    def update_eventorder(self, events: list):
+        """Update the event ordering of a chronology.
         
-    #     Parameters
-    #     ----------
-    #     events: list
-    #         A list of events in the chronology is the order they should appear.
-            
-    #     Returns
-    #     -------
-    #     string
-    #         A message stating that the event order has been updated.
-
-    #     Examples
-    #     --------
-
-    #     """
-    #     if self.chronology[KEYS['NAME']] == '':
-    #         raise ValueError('The chronology name is empty.')
-    #     else:
-    #         self.eventorder = events
-    #         return f'The event ordering of the "{self.name}" has been updated.'
+        Parameters
+        ----------
+        events: list
+            A list of events in the chronology is the order they should appear.
+
+        Examples
+        --------
+
+        """
+        dictionary = self.chronology[KEYS['EVENTS']]
+        if len(events) != len(dictionary) or set(events) != dictionary.keys():
+            raise ValueError(f'The events {events} are not the events of the "{self.name}" chronology.')
+        self.chronology[KEYS['EVENTS']] = {event : dictionary[event] for event in events}
+
+    def sort_events(self):
+        """Order the events of a chronology by the dates they begin.
+
+        Events may be added in any order and sorted when needed.  Events with
+        the same date keep their order.
+
+        See Also
+        --------
+        `update_eventorder`
+            Order the events by a list of their names.
+        """
+        columns = self._numericcolumns(KEYS['EVENTS'])
+        order = np.argsort(columns[KEYS['BEGIN']], kind='stable')
+        self.update_eventorder(list(columns[KEYS['NAME']][order]))
         
     ###### MARKERS 
 
     def markers(self) -> pd.DataFrame:
         """Display the markers in a chronology."""
         if len(self.chronology[KEYS['MARKERS']]) > 0:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['MARKERS']], orient='index')
+            return self._dataframe(KEYS['MARKERS'])
         else:
             print(f'The chronology "{self.name}" has no markers.')
 
@@ -821,22 +1061,14 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the markers.
             
         """
-        self.dictionary_pop(self, pops, KEYS['MARKERS'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['MARKERS']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
+        return self.dictionary_pop(pops, KEYS['MARKERS'])
 
     ###### PERIODS 
 
     def periods(self) -> pd.DataFrame:
         """Display the periods defined for the chronology if there are any."""
         if self.chronology[KEYS['PERIODS']] is not None:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['PERIODS']], orient='index')
+            return self._dataframe(KEYS['PERIODS'])
         else:
             print(f'The chronology "{self.name}" has no periods.')
 
@@ -849,29 +1081,12 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the periods.
             
         """
-        self.dictionary_pop(self, pops, KEYS['PERIODS'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['PERIODS']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
+        return self.dictionary_pop(pops, KEYS['PERIODS'])
 
     
-    def add_period(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+    def add_period(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add a period to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['PERIODS'], name, begin, end, keyvalues)
 
     def remove_period(self, name):
         """Remove a period from the dictionary."""
@@ -879,25 +1094,74 @@ class Chronology():
 
     ###### SAVE 
 
-    def save(self, filename: str = ''):
+    def _savefile(self, filename: str) -> str:
+        """Return the file to save to, defaulting to the file the chronology was read from."""
         if filename == '':
             if self.filename == '':
-                raise ValueError(f'No file name has been provided.')
+                raise ValueError('No file name has been provided.')
             else:
-                file = self.filename
+                return self.filename
         else:
-            file=filename
+            return filename
+
+    def save(self, filename: str = ''):
+        file = self._savefile(filename)
         with open(file, 'w') as f:
-            for i in self.commentlist:
-                f.write('%s\n' % i)
-            for key, value in self.chronology.items():
-                if isinstance(value, dict):
-                    f.write("{'%s' : %s}\n" % (key, value))
-                else:
-                    f.write("{'%s' : '%s'}\n" % (key, value))
-
-    def save_as_json(self):
-        pass
+            f.writelines(comment + CONSTANTS['NEWLINE'] for comment in self.commentlist)
+            f.writelines(json.dumps({key : value}, ensure_ascii=False, default=str) + CONSTANTS['NEWLINE']
+                         for key, value in self.chronology.items())
+
+    def save_as_json(self, filename: str):
+        """Save the comments and chronology as a single JSON document.
+
+        The file is read back as this format whatever its name.
+
+        Parameters
+        ----------
+        filename: str
+            The file to save to.  It must be given so that a file saved
+            with `save` is not overwritten in another format.
+        """
+        if filename == '':
+            raise ValueError('No file name has been provided.')
+        document = {
+            CONSTANTS['COMMENTS'] : self.commentlist,
+            CONSTANTS['CHRONOLOGY'] : self.chronology,
+        }
+        with open(filename, 'w') as f:
+            f.write(json.dumps(document, ensure_ascii=False, default=str))
+
+    def save_as_npz(self, filename: str = ''):
+        """Save the chronology with the numeric dates of its dictionaries in a NumPy archive.
+
+        The comments and chronology are stored as one JSON document alongside
+        the `BEGIN` and `END` numeric dates of each dictionary as `datetime64`
+        arrays.  A dictionary with a date that cannot be converted is saved
+        without numeric dates.  A file name ending in `.npz` is read back as
+        this format from the JSON document.
+
+        Parameters
+        ----------
+        filename: str (Optional)
+            The file to save to.  The default is the file the chronology was
+            read from.  NumPy adds `.npz` to a name that does not end with it.
+        """
+        file = self._savefile(filename)
+        document = {
+            CONSTANTS['COMMENTS'] : self.commentlist,
+            CONSTANTS['CHRONOLOGY'] : self.chronology,
+        }
+        arrays = {CONSTANTS['CHRONOLOGY'] : np.array(json.dumps(document, ensure_ascii=False, default=str))}
+        for dictname in self.maindictionaries:
+            columns = _datecolumns(self.chronology[dictname])
+            try:
+                dates = self.numericdates(np.stack([columns[KEYS['BEGIN']], columns[KEYS['END']]]))
+            except ValueError as error:
+                print(f'The dictionary "{dictname}" is saved without numeric dates: {error}')
+                continue
+            arrays[f'{dictname} {KEYS["BEGIN"]}'] = dates[0]
+            arrays[f'{dictname} {KEYS["END"]}'] = dates[1]
+        np.savez_compressed(file, **arrays)
 
     def save_as_html(self):
         pass
@@ -911,7 +1175,7 @@ class Chronology():
     def texts(self) -> pd.DataFrame:
         """Display the texts referenced to justify a chronology."""
         if len(self.chronology[KEYS['TEXTS']]) > 0:
-            return pd.DataFrame.from_dict(self.chronology[KEYS['TEXTS']], orient='index')
+            return self._dataframe(KEYS['TEXTS'])
         else:
             print(f'The chronology "{self.name}" has no texts referenced to justify the chronology.')
 
@@ -924,35 +1188,18 @@ class Chronology():
             A list of keys to be temporarily removed before displaying the texts.
             
         """
-        self.dictionary_pop(self, pops, KEYS['TEXTS'])
-        # dictionary = copy.deepcopy(dict(self.chronology[KEYS['TEXTS']]))
-        # for i in pops:
-        #     for j in dictionary:
-        #         try:
-        #             dictionary[j].pop(i)
-        #         except KeyError:
-        #             break
-        # return pd.DataFrame.from_dict(dictionary, orient='index')
-
-    def add_text(self, name: str, begin: str, end: str, keyvalues: dict = {}):
+        return self.dictionary_pop(pops, KEYS['TEXTS'])
+
+    def add_text(self, name: str, begin: str, end: str, keyvalues: dict | None = None):
         """Add a text to the dictionary."""
-        for i in keyvalues.keys():
-            if i in KEYS.keys():
-                raise ValueError(f'The key "{i}" is a reserved key.')
-        else:
-            self.chronology[KEYS['PERIODS']].update({name : {
-                KEYS['BEGIN'] : begin,
-                KEYS['END'] : end,
-            }})
-            if len(keyvalues) > 0:
-                self.chronology[KEYS['PERIODS']][name].update(keyvalues)
+        self._add(KEYS['TEXTS'], name, begin, end, keyvalues)
 
     def remove_text(self, name):
         """Remove a text from the dictionary."""
         self.chronology[KEYS['TEXTS']].pop(name)
 
 
-    def combine(self, chronologyname: str, chronology: dict, comments: list = [], keepcomments: bool = True):
+    def combine(self, chronologyname: str, chronology: dict, comments: list | None = None, keepcomments: bool = True):
         """Return a new chronology containing a combination of the current one and another chronology.
 
         The two source chronologies are not changed.  A new chronology containing both 
@@ -976,15 +1223,17 @@ class Chronology():
             Add the comments from the self chronology into the new chronology.
         """
 
-        newchron = Chronology(chronologyname=chronologyname, cal=self.calendar)
-        if self.calendar == chronology[KEYS['CALENDAR']]:
+        calendar = chronology[KEYS['CALENDAR']][KEYS['NAME']]
+        if self.calendar == calendar:
+            newchron = Chronology(chronologyname=chronologyname, calendar=self.calendar)
             if keepcomments:
-                newchron.comments.extend(self.comments)
-            newchron.comments.extend(comments)
+                newchron.commentlist.extend(self.commentlist)
+            if comments:
+                newchron.commentlist.extend(comments)
             for key in self.maindictionaries:
-                newchron.chronology[key].update(self.chronology[key])
-                newchron.chronology[key].update(chronology[key])
+                combined = self.chronology[key] | chronology[key]
+                newchron.chronology[key] = {name : dict(entry) for name, entry in combined.items()}
             return newchron
         else:
-            raise ValueError(f'The calendars "{self.calendar}" and "{chronology[KEYS['CALENDAR']]}" do not match.')
+            raise ValueError(f'The calendars "{self.calendar}" and "{calendar}" do not match.')
             
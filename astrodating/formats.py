@@ -11,14 +11,6 @@ to implement the functionality with a wider range of dates than those offered
 in AstroPy.
 ."""
 
-import time
-import warnings
-import erfa
-
-import numpy as np
-import astropy.units as u
-from astropy import constants as const
-from astropy.time import Time
 from astropy.time.formats import TimeUnique
 
 __all__ = [
@@ -0,0 +1,421 @@
+# Licensed under a 3-clause BSD style license - see LICENSE
+"""Test chronology functions."""
+
+import numpy as np
+import pytest
+
+from astrodating.chronology import Chronology
+
+
+def test_numericdate() -> None:
+    chronology = Chronology(chronologyname='Test')
+
+    assert chronology.numericdate('2024 AD') == np.datetime64('2024')
+    assert chronology.numericdate('2024') == np.datetime64('2024')
+    assert chronology.numericdate('0001 BC') == np.datetime64('0000-01-01')
+    assert chronology.numericdate('4004 BC') == np.datetime64('-4003-01-01')
+
+    # Repeated dates are served from the cache with the same value.
+    assert chronology.numericdate('4004 BC') == np.datetime64('-4003-01-01')
+
+
+def test_numericdate_numpy_strings() -> None:
+    chronology = Chronology(chronologyname='Test')
+    assert chronology.numericdate(np.str_('2024')) == np.datetime64('2024-01-01')
+    assert chronology.numericdate(np.str_('2024 AD')) == np.datetime64('2024-01-01')
+    assert chronology.numericdate(np.str_('0970 BC')) == np.datetime64('-0969-01-01')
+    assert chronology.numericdate('2024') == np.datetime64('2024-01-01')
+
+
+def test_numericdates() -> None:
+    chronology = Chronology(chronologyname='Test')
+    dates = ['2024 AD', '2024', '0001 BC', '4004 BC', '1000-06-15 BC', '-0050']
+
+    expected = np.array([chronology.numericdate(date) for date in dates])
+    assert np.array_equal(chronology.numericdates(dates), expected)
+    assert np.array_equal(chronology.numericdate(dates), expected)
+
+
+def test_periods_follow_changes() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    assert list(chronology.periods().index) == ['Reign']
+
+    chronology.add_period('Exile', '0586 BC', '0538 BC')
+    assert list(chronology.periods().index) == ['Reign', 'Exile']
+
+    chronology.remove_period('Reign')
+    assert list(chronology.periods().index) == ['Exile']
+
+    chronology.chronology['PERIODS']['Reign'] = {'BEGIN' : '0970 BC', 'END' : '0931 BC'}
+    assert list(chronology.periods().index) == ['Exile', 'Reign']
+
+
+def test_numericdate_without_labels() -> None:
+    chronology = Chronology(chronologyname='Test', calendar='Before Present')
+
+    assert chronology.numericdate('2024') == np.datetime64('2024')
+    assert chronology.numericdate('-0050') == np.datetime64('-0050')
+    assert chronology.numericdate('0001 BP') == np.datetime64('0000-01-01')
+
+
+def test_daysinyears() -> None:
+    chronology = Chronology(chronologyname='Test')
+    years = [1900, 2000, 2023, 2024, 0, -100, -400]
+
+    assert list(chronology.daysinyears(years)) == [365, 366, 365, 366, 366, 365, 366]
+
+
+def test_update_eventorder() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.chronology['EVENTS'].update({'Flood': {}, 'Creation': {}})
+    assert chronology.show_eventorder() == ['Flood', 'Creation']
+
+    chronology.update_eventorder(['Creation', 'Flood'])
+    assert chronology.show_eventorder() == ['Creation', 'Flood']
+
+
+def test_save_and_load(tmp_path) -> None:
+    filename = str(tmp_path / 'test.txt')
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_comment('A test chronology.')
+    chronology.add_period('Reign', '0970 BC', '0931 BC', {'KING' : 'Solomon'})
+    chronology.save(filename)
+
+    loaded = Chronology(filename=filename)
+    assert loaded.commentlist == chronology.commentlist
+    assert loaded.chronology == chronology.chronology
+    assert loaded.name == 'Test'
+    assert loaded.numericdate('0970 BC') == chronology.numericdate('0970 BC')
+
+
+def test_load_python_literals(tmp_path) -> None:
+    filename = tmp_path / 'test.txt'
+    filename.write_text("# An older file.\n{'NAME' : 'Test'}\n{'PERIODS' : {'Reign' : {'BEGIN' : '0970 BC', 'END' : '0931 BC'}}}\n")
+
+    loaded = Chronology(filename=str(filename))
+    assert loaded.commentlist == ['# An older file.']
+    assert loaded.chronology['NAME'] == 'Test'
+    assert loaded.chronology['PERIODS']['Reign']['END'] == '0931 BC'
+
+
+def test_daysinyear() -> None:
+    chronology = Chronology(chronologyname='Test')
+
+    assert chronology.daysinyear('2024') == 366
+    assert chronology.daysinyear('2023-07-04') == 365
+    assert chronology.daysinyear('-0100-03-01') == 365
+    assert chronology.daysinyear('-0400') == 366
+    assert chronology.daysinyear(np.datetime64('1900-03-01')) == 365
+    assert list(chronology.daysinyear(['2000', '2023-07-04'])) == [366, 365]
+
+    for date in ['2024-13-45', '2024-99']:
+        with pytest.raises(ValueError):
+            chronology.daysinyear(date)
+
+
+def test_str_follows_changes() -> None:
+    chronology = Chronology(chronologyname='Test')
+    assert str(chronology) == str(chronology.chronology)
+
+    chronology.rename('Renamed')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    assert str(chronology) == str(chronology.chronology)
+
+    chronology.chronology['NAME'] = 'Changed'
+    assert 'Changed' in str(chronology)
+
+
+def test_sort_events() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.chronology['EVENTS'].update({
+        'Exodus': {'BEGIN': '1446 BC'},
+        'Temple': {'BEGIN': '0966 BC'},
+        'Flood': {'BEGIN': '2348 BC'},
+    })
+
+    chronology.sort_events()
+    assert chronology.show_eventorder() == ['Flood', 'Exodus', 'Temple']
+
+
+def test_save_as_json(tmp_path) -> None:
+    filename = str(tmp_path / 'test.json')
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_comment('A test chronology.')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    chronology.save_as_json(filename)
+
+    loaded = Chronology(filename=filename)
+    assert loaded.commentlist == chronology.commentlist
+    assert loaded.chronology == chronology.chronology
+
+    with pytest.raises(ValueError):
+        loaded.save_as_json('')
+
+
+def test_file_format_follows_content(tmp_path) -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_comment('A test chronology.')
+    chronology.add_period('Reign', '0970 BC', '0931 BC', {'COMMENTS' : 'A note.'})
+    lines = str(tmp_path / 'lines.json')
+    document = str(tmp_path / 'document.txt')
+    chronology.save(lines)
+    chronology.save_as_json(document)
+
+    for filename in [lines, document]:
+        loaded = Chronology(filename=filename)
+        assert loaded.name == 'Test'
+        assert loaded.commentlist == chronology.commentlist
+        assert loaded.chronology == chronology.chronology
+
+
+def test_load_unknown_calendar(tmp_path) -> None:
+    filename = tmp_path / 'islamic.txt'
+    filename.write_text('{"NAME": "Hijra"}\n{"CALENDAR": {"NAME": "Islamic", "POS LABEL": " AH"}}\n')
+
+    loaded = Chronology(filename=str(filename))
+    assert loaded.calendar == 'Islamic'
+    assert loaded.numericdate('1446 AH') == np.datetime64('1446-01-01')
+
+
+def test_numericdate_errors() -> None:
+    chronology = Chronology(chronologyname='Test')
+
+    for date in ['-0050 BC', '-0050 AD']:
+        with pytest.raises(ValueError):
+            chronology.numericdate(date)
+        with pytest.raises(ValueError):
+            chronology.numericdates([date])
+
+
+def test_numericdate_out_of_range() -> None:
+    chronology = Chronology(chronologyname='Test')
+    for date in ['1000000000000', '300000000000 BC', '-300000000000-05-01']:
+        with pytest.raises(ValueError):
+            chronology.numericdate(date)
+        with pytest.raises(ValueError):
+            chronology.numericdates(['2024', date])
+    assert chronology.numericdate('200000000000') == np.datetime64('200000000000', 'Y')
+    assert chronology.numericdates(['2024-03-01T12:00:00']) == np.datetime64('2024-03-01T12:00:00')
+
+
+def test_dictionary_numeric() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    chronology.add_period('Exile', '0586 BC', '0538 BC')
+
+    dataframe = chronology.dictionary_numeric('PERIODS')
+    assert dataframe.loc['Reign', 'BEGIN'] == chronology.numericdate('0970 BC')
+    assert dataframe.loc['Exile', 'END'] == chronology.numericdate('0538 BC')
+    assert chronology.periods().loc['Reign', 'BEGIN'] == '0970 BC'
+
+
+def test_numeric_columns_follow_changes() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.chronology['EVENTS'].update({'Exodus': {'BEGIN': '1446 BC'}})
+    assert list(chronology.dictionary_numeric('EVENTS')['BEGIN']) == [chronology.numericdate('1446 BC')]
+
+    chronology.remove_event('Exodus')
+    chronology.chronology['EVENTS'].update({'Temple': {'BEGIN': '0966 BC'}})
+    chronology.update_eventorder(['Temple'])
+    assert list(chronology.dictionary_numeric('EVENTS')['BEGIN']) == [chronology.numericdate('0966 BC')]
+
+    chronology.chronology['EVENTS']['Exile'] = {'BEGIN': '0586 BC'}
+    assert list(chronology.dictionary_numeric('EVENTS')['BEGIN']) == [
+        chronology.numericdate('0966 BC'),
+        chronology.numericdate('0586 BC'),
+    ]
+
+
+def test_dataframes_are_copies() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+
+    for dataframe in [chronology.keys(), chronology.calendars(), chronology.datetimes(), chronology.periods()]:
+        dataframe.iloc[0, 0] = 'Changed'
+
+    assert chronology.keys().iloc[0, 0] == 'ACTORS'
+    assert chronology.calendars().iloc[0, 0] != 'Changed'
+    assert chronology.datetimes().iloc[0, 0] != 'Changed'
+    assert chronology.periods().iloc[0, 0] == '0970 BC'
+
+
+def test_to() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 AD')
+    chronology.chronology['EVENTS'].update({'Exodus': {'BEGIN': '1446 BC'}})
+
+    chronology.to('Secular')
+    assert chronology.chronology['PERIODS']['Reign'] == {'BEGIN' : '0970 BCE', 'END' : '0931 CE'}
+    assert chronology.chronology['EVENTS']['Exodus'] == {'BEGIN' : '1446 BCE'}
+    assert chronology.chronology['CALENDAR']['NAME'] == 'Secular'
+    assert chronology.numericdate('0970 BCE') == np.datetime64('-0969-01-01')
+
+
+def test_to_without_events() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 AD')
+
+    chronology.to('Secular')
+    assert chronology.chronology['PERIODS']['Reign'] == {'BEGIN' : '0970 BCE', 'END' : '0931 CE'}
+    assert chronology.chronology['EVENTS'] == {}
+    assert chronology.chronology['CALENDAR']['NAME'] == 'Secular'
+    assert chronology.calendar == 'Secular'
+
+    empty = Chronology(chronologyname='Empty')
+    empty.to('Secular')
+    assert empty.calendar == 'Secular'
+
+
+def test_to_keeps_direct_changes() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    chronology.dictionary_numeric('PERIODS')
+    chronology.chronology['PERIODS']['Reign']['BEGIN'] = '1000 BC'
+
+    chronology.to('Secular')
+    assert chronology.chronology['PERIODS']['Reign'] == {'BEGIN' : '1000 BCE', 'END' : '0931 BCE'}
+
+
+def test_to_clears_numeric_dates() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_actor('Solomon', '0990 BC', '0931 BC')
+    chronology.dictionary_numeric('ACTORS')
+
+    chronology.to('Secular')
+    with pytest.raises(ValueError):
+        chronology.dictionary_numeric('ACTORS')
+
+
+def test_dictionaries(capsys) -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+
+    chronology.dictionaries()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'NAME : Test'
+    assert lines[1] == 'ACTORS : {}'
+    assert "    Reign : {'BEGIN': '0970 BC', 'END': '0931 BC'}" in lines
+
+
+def test_stringdates() -> None:
+    chronology = Chronology(chronologyname='Test')
+    dates = [np.datetime64('2024-03-01'), np.datetime64('-0969-01-01'), None]
+
+    assert list(chronology.stringdates(dates)) == ['2024-03-01', '-969-01-01', '']
+    assert chronology.stringdates(dates)[0] == chronology.stringdate(dates[0])
+
+
+def test_save_numeric_values(tmp_path) -> None:
+    filename = str(tmp_path / 'test.txt')
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC', {'NUMERIC' : np.datetime64('2024-03-01')})
+    chronology.save(filename)
+
+    loaded = Chronology(filename=filename)
+    assert loaded.chronology['PERIODS']['Reign']['NUMERIC'] == '2024-03-01'
+
+
+def test_load_mixed_lines(tmp_path) -> None:
+    filename = tmp_path / 'test.txt'
+    filename.write_text('{"NAME": "Test", "DRAFT": true}\n{\'PERIODS\' : {\'Reign\' : {\'BEGIN\' : \'0970 BC\'}}}\n')
+
+    loaded = Chronology(filename=str(filename))
+    assert loaded.chronology['DRAFT'] is True
+    assert loaded.chronology['PERIODS']['Reign']['BEGIN'] == '0970 BC'
+
+
+def test_periods_pop() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period('Reign', '0970 BC', '0931 BC', {'KING' : 'Solomon'})
+    chronology.add_period('Exile', '0586 BC', '0538 BC')
+
+    dataframe = chronology.periods_pop(['END', 'KING'])
+    assert list(dataframe.columns) == ['BEGIN']
+    assert chronology.chronology['PERIODS']['Reign']['KING'] == 'Solomon'
+
+
+def test_add_comment() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_comment('First line.\nSecond line.')
+    chronology.add_comment()
+
+    assert chronology.commentlist == ['First line.', 'Second line.', ' ']
+
+
+def test_comments(capsys) -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.comments()
+    assert capsys.readouterr().out == ''
+
+    chronology.add_comment('First line.\nSecond line.')
+    chronology.comments()
+    assert capsys.readouterr().out == '  0 : First line.\n  1 : Second line.\n'
+
+
+def test_add_to_own_dictionary() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_actor('Solomon', '0990 BC', '0931 BC')
+    chronology.add_challenge('Dating', '0970 BC', '0931 BC')
+    chronology.add_event('Temple', '0966 BC', '0959 BC', {'PLACE' : 'Jerusalem'})
+    chronology.add_text('Kings', '0560 BC', '0560 BC')
+
+    assert list(chronology.chronology['ACTORS']) == ['Solomon']
+    assert list(chronology.chronology['CHALLENGES']) == ['Dating']
+    assert chronology.chronology['EVENTS']['Temple'] == {'BEGIN' : '0966 BC', 'END' : '0959 BC', 'PLACE' : 'Jerusalem'}
+    assert list(chronology.chronology['TEXTS']) == ['Kings']
+    assert chronology.chronology['PERIODS'] == {}
+    assert list(chronology.events().index) == ['Temple']
+
+    with pytest.raises(ValueError):
+        chronology.add_event('Exodus', '1446 BC', '1446 BC', {'BEGIN' : '1446 BC'})
+
+
+def test_add_with_numeric_name() -> None:
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_period(5, '0970 BC', '0931 BC')
+    assert chronology.chronology['PERIODS'][5] == {'BEGIN' : '0970 BC', 'END' : '0931 BC'}
+
+
+def test_save_as_npz(tmp_path) -> None:
+    filename = str(tmp_path / 'test.npz')
+    chronology = Chronology(chronologyname='Test')
+    chronology.add_comment('A test chronology.')
+    chronology.add_period('Reign', '0970 BC', '0931 BC')
+    chronology.add_event('Temple', '0966 BC', '0959 BC')
+    chronology.save_as_npz(filename)
+
+    loaded = Chronology(filename=filename)
+    assert loaded.commentlist == chronology.commentlist
+    assert loaded.chronology == chronology.chronology
+    assert loaded.dictionary_numeric('PERIODS').loc['Reign', 'BEGIN'] == chronology.numericdate('0970 BC')
+    assert loaded.dictionary_numeric('EVENTS').loc['Temple', 'END'] == chronology.numericdate('0959 BC')
+
+    chronology.chronology['PERIODS']['Reign']['BEGIN'] = '1000 BC'
+    chronology.add_text('Kings', 'Unknown', '')
+    chronology.save_as_npz(filename)
+    with np.load(filename) as arrays:
+        assert arrays['PERIODS BEGIN'][0] == chronology.numericdate('1000 BC')
+        assert 'TEXTS BEGIN' not in arrays
+    assert Chronology(filename=filename).chronology == chronology.chronology
+
+
+def test_combine() -> None:
+    first = Chronology(chronologyname='First')
+    first.add_comment('The first chronology.')
+    first.add_period('Reign', '0970 BC', '0931 BC')
+    second = Chronology(chronologyname='Second')
+    second.add_period('Exile', '0586 BC', '0538 BC')
+
+    combined = first.combine('Combined', second.chronology, ['The second chronology.'])
+    assert combined.name == 'Combined'
+    assert combined.commentlist == ['The first chronology.', 'The second chronology.']
+    assert list(combined.periods().index) == ['Reign', 'Exile']
+    assert list(first.chronology['PERIODS']) == ['Reign']
+
+    combined.to('Secular')
+    assert first.chronology['PERIODS']['Reign'] == {'BEGIN' : '0970 BC', 'END' : '0931 BC'}
+    assert second.chronology['PERIODS']['Exile'] == {'BEGIN' : '0586 BC', 'END' : '0538 BC'}
+
+    with pytest.raises(ValueError):
+        first.combine('Combined', Chronology(chronologyname='Third', calendar='Secular').chronology)
@@ -15,3 +15,30 @@ def test_vsl() -> None:
     assert c.name
     assert c.reference
     assert c.unit
+
+
+def test_lightspeed() -> None:
+    import numpy as np
+    from astropy.constants import c
+
+    from astrodating.time import VSL
+
+    vsl = VSL("Test")
+    assert vsl.lightspeed() == c
+    assert vsl.lightspeed(2) == 2 * c
+    assert np.all(vsl.lightspeed(np.array([1.0, 0.5])) == [1.0, 0.5] * c)
+    assert vsl.lightspeed(2, return_quantity=False) == 2 * c.value
+    assert not hasattr(vsl, "__dict__")
+    assert VSL.lightspeed(0.5) == 0.5 * c
+
+
+def test_lightspeed_array() -> None:
+    import numpy as np
+    from astropy.constants import c
+
+    from astrodating.time import VSL
+
+    out = np.empty(2)
+    speeds = VSL.lightspeed_array(np.array([1.0, 0.5]), out=out)
+    assert np.all(speeds == [1.0, 0.5] * c)
+    assert np.shares_memory(speeds, out)
@@ -1,7 +1,27 @@
 # vsl.py
 """The vsl class with its functions."""
 
-from astropy import constants as const
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import astropy.units as u
+
+
+@functools.lru_cache(maxsize=1)
+def _speedoflight() -> tuple[float, u.UnitBase]:
+    """Return the value and unit of the speed of light.
+
+    Importing astropy's units and constants takes a large part of a second,
+    so it is only done the first time a speed of light is needed.
+    """
+    from astropy import constants as const
+
+    return float(const.c.value), const.c.unit
 
 
 class VSL:
@@ -12,6 +32,8 @@ class VSL:
     and continuous integration.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self: "VSL", name: str) -> None:
         """Initialize the VSL clase."""
         self.name = name
@@ -21,25 +43,58 @@ class VSL:
         return self.name
 
     # @u.quantity_input(speedfactor: u.dimensionless_unscaled)
-    def lightspeed(self: "VSL", speedfactor: float = 1.0) -> float:
+    @staticmethod
+    def lightspeed(speedfactor: float = 1.0, return_quantity: bool = True) -> u.Quantity | float:
         """Return the speed of light based on a variable speed factor.
 
         Parameters
         ----------
-        speedfactor : float
+        speedfactor : float or np.ndarray
             The theoretically defined factor to obtain a speed of light.
             For constant speed of light theories this factor is 1, the default.
+        return_quantity : bool
+            Return a Quantity, the default, or the plain value in m / s for
+            callers that do not need units.
+
+        Returns
+        -------
+        newlightspeed : u.Quantity or float
+            The new light speed in m / s based on the constant and the speedfactor.
+
+        Examples
+        --------
+        >>> VSL.lightspeed()
+
+        """
+        value, unit = _speedoflight()
+        # Attaching the unit with << does not copy the result as multiplying by c would.
+        newlightspeed = np.multiply(speedfactor, value)
+        if not return_quantity:
+            return newlightspeed
+        return newlightspeed << unit
+
+    @staticmethod
+    def lightspeed_array(speedfactors: np.ndarray, out: np.ndarray | None = None) -> u.Quantity:
+        """Return the speeds of light for an array of speed factors.
+
+        Parameters
+        ----------
+        speedfactors : np.ndarray
+            The speed factors, as in `lightspeed`.
+        out : np.ndarray
+            A float64 array with the shape of `speedfactors` to write the speeds
+            into.  A caller converting many arrays may allocate it once and pass
+            it on each call.
 
         Returns
         -------
-        newlightspeed : float
-            The new light speed based on the constant and the speedfactor.
+        newlightspeeds : u.Quantity
+            The light speeds in m / s, sharing memory with `out` when it is given.
 
         Examples
         --------
-        >>> vsl.lightspeed()
+        >>> VSL.lightspeed_array(np.array([1.0, 0.5]))
 
         """
-        newlightspeed = speedfactor * const.C
-        assert isinstance(newlightspeed, float)
-        return newlightspeed
+        value, unit = _speedoflight()
+        return np.multiply(speedfactors, value, out=out) << unit